@@ -6,6 +6,7 @@ from utils import resource_path
 APP_NAME = "AppLauncher"
 APPDATA_PATH = os.path.join(os.environ.get("APPDATA", os.path.expanduser("~")), APP_NAME)
 CONFIG_PATH = os.path.join(APPDATA_PATH, "config.json")
+HISTORY_PATH = os.path.join(APPDATA_PATH, "history.json")
 
 if not os.path.exists(CONFIG_PATH):
     default_config = resource_path("config.json")
@@ -40,4 +41,21 @@ def save_config(config):
             json.dump(config, f, indent=4)
     except Exception as e:
         print(f"Failed to save config: {e}")
-    pass
\ No newline at end of file
+    pass
+
+def load_history():
+    if os.path.exists(HISTORY_PATH):
+        try:
+            with open(HISTORY_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Failed to load launch history: {e}")
+    return {}
+
+def save_history(history):
+    try:
+        os.makedirs(APPDATA_PATH, exist_ok=True)
+        with open(HISTORY_PATH, 'w', encoding='utf-8') as f:
+            json.dump(history, f)
+    except Exception as e:
+        print(f"Failed to save launch history: {e}")
@@ -0,0 +1,216 @@
+import os
+import re
+import csv
+import json
+import shlex
+import struct
+
+SHORTCUT_EXTENSIONS = (".desktop", ".lnk")
+
+# Field codes like %f, %U, %i that .desktop Exec lines may contain; %% is a literal %
+_DESKTOP_FIELD_CODE = re.compile(r"%(.)")
+
+
+def entry_key(entry):
+    """Dedupe key for an app entry: the normalized command it launches"""
+    command = entry.get("command", "") if isinstance(entry, dict) else str(entry)
+    return os.path.normcase(os.path.normpath(command.strip())) if command.strip() else ""
+
+
+def build_key_index(entries):
+    index = set()
+    for entry in entries:
+        if isinstance(entry, dict) and "folder" in entry:
+            index |= build_key_index(entry.get("apps", []))
+        else:
+            key = entry_key(entry)
+            if key:
+                index.add(key)
+    return index
+
+
+class UnsupportedEntry(ValueError):
+    """A shortcut that can't be expressed as a launcher command"""
+
+
+def _desktop_exec_program(value):
+    """Program from a .desktop Exec line.
+
+    launch_app treats a command as a single path, so Exec lines that need arguments,
+    including wrappers such as `env FOO=1 app` or `flatpak run org.X.App`, are rejected
+    rather than collapsed into the wrapper alone.
+    """
+    value = _DESKTOP_FIELD_CODE.sub(lambda m: "%" if m.group(1) == "%" else "", value)
+    try:
+        parts = shlex.split(value)
+    except ValueError:
+        raise UnsupportedEntry(f"unparseable Exec line: {value}")
+    if len(parts) > 1:
+        raise UnsupportedEntry(f"Exec line needs arguments: {value.strip()}")
+    return parts[0] if parts else None
+
+
+def parse_desktop_file(path):
+    name = exec_line = icon = None
+    in_entry = False
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("["):
+                # Only the main group describes the app; actions come after it
+                if in_entry:
+                    break
+                in_entry = line == "[Desktop Entry]"
+                continue
+            if not in_entry or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            key = key.strip()
+            if key == "Name" and name is None:
+                name = value.strip()
+            elif key == "Exec":
+                exec_line = value
+            elif key == "Icon":
+                icon = value.strip()
+            elif key in ("NoDisplay", "Hidden") and value.strip().lower() == "true":
+                # Hidden=true means the entry has been deleted
+                return None
+    command = _desktop_exec_program(exec_line) if exec_line is not None else None
+    if not command:
+        return None
+    app = {"name": name or os.path.splitext(os.path.basename(path))[0], "command": command}
+    if icon:
+        app["icon"] = icon
+    return app
+
+
+def _read_lnk_target(data):
+    # See [MS-SHLLINK]: header, optional LinkTargetIDList, optional LinkInfo
+    if len(data) < 0x4C or struct.unpack_from("<I", data, 0)[0] != 0x4C:
+        return None
+    flags = struct.unpack_from("<I", data, 0x14)[0]
+    offset = 0x4C
+    if flags & 0x01:  # HasLinkTargetIDList
+        offset += 2 + struct.unpack_from("<H", data, offset)[0]
+    if not flags & 0x02:  # HasLinkInfo
+        return None
+    base_offset = struct.unpack_from("<I", data, offset + 16)[0]
+    if not base_offset:
+        return None
+    start = offset + base_offset
+    end = data.find(b"\x00", start)
+    if end == -1:
+        return None
+    return data[start:end].decode("mbcs" if os.name == "nt" else "latin-1", errors="replace")
+
+
+def parse_lnk_file(path):
+    try:
+        with open(path, "rb") as f:
+            target = _read_lnk_target(f.read())
+    except (OSError, struct.error):
+        target = None
+    # "start" resolves .lnk files itself, so the shortcut works as a fallback command
+    return {"name": os.path.splitext(os.path.basename(path))[0], "command": target or path}
+
+
+def _iter_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    entries = data.get("apps", []) if isinstance(data, dict) else data
+
+    def walk(items):
+        for item in items:
+            if isinstance(item, dict) and "folder" in item:
+                yield from walk(item.get("apps", []))
+            elif isinstance(item, dict) and item.get("command"):
+                app = {"name": item.get("name") or item["command"], "command": item["command"]}
+                if item.get("icon"):
+                    app["icon"] = item["icon"]
+                yield app
+            elif isinstance(item, str) and item:
+                yield {"name": item, "command": item}
+
+    yield from walk(entries)
+
+
+def _iter_csv(path):
+    # utf-8-sig strips the BOM that Excel puts in front of the header
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = None
+        for row in reader:
+            if not row or not any(cell.strip() for cell in row):
+                continue
+            cells = [cell.strip() for cell in row]
+            if header is None and "command" in (c.lower() for c in cells):
+                header = [c.lower() for c in cells]
+                continue
+            record = dict(zip(header or ["name", "command", "icon"], cells))
+            command = record.get("command")
+            if not command:
+                continue
+            app = {"name": record.get("name") or command, "command": command}
+            if record.get("icon"):
+                app["icon"] = record["icon"]
+            yield app
+
+
+def _report_unsupported(path, reason):
+    print(f"Skipped {path}: {reason}")
+
+
+def _iter_directory(path, on_unsupported):
+    # os.scandir streams entries instead of listing the whole tree up front
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for item in it:
+                    if item.is_dir(follow_symlinks=False):
+                        stack.append(item.path)
+                        continue
+                    ext = os.path.splitext(item.name)[1].lower()
+                    if ext not in SHORTCUT_EXTENSIONS:
+                        continue
+                    try:
+                        app = parse_desktop_file(item.path) if ext == ".desktop" else parse_lnk_file(item.path)
+                    except OSError as e:
+                        print(f"Failed to read {item.path}: {e}")
+                        continue
+                    except UnsupportedEntry as e:
+                        on_unsupported(item.path, str(e))
+                        continue
+                    if app:
+                        yield app
+        except OSError as e:
+            print(f"Failed to read {current}: {e}")
+
+
+def iter_entries(source, on_unsupported=_report_unsupported):
+    """Yield app entries from a directory of shortcuts or a JSON/CSV list, one at a time.
+
+    Shortcuts that can't be imported are passed to on_unsupported(path, reason) instead.
+    """
+    if os.path.isdir(source):
+        yield from _iter_directory(source, on_unsupported)
+        return
+    ext = os.path.splitext(source)[1].lower()
+    if ext == ".json":
+        yield from _iter_json(source)
+    elif ext == ".csv":
+        yield from _iter_csv(source)
+    elif ext == ".desktop":
+        try:
+            app = parse_desktop_file(source)
+        except UnsupportedEntry as e:
+            on_unsupported(source, str(e))
+            return
+        if app:
+            yield app
+    elif ext == ".lnk":
+        yield parse_lnk_file(source)
+    else:
+        raise ValueError(f"Unsupported import source: {source}")
+
@@ -0,0 +1,234 @@
+import os
+import time
+import shlex
+import shutil
+import threading
+from collections import deque
+from statistics import mean, median
+
+HISTORY_HALF_LIFE = 7 * 24 * 3600  # Seconds before a past launch counts half as much
+DEFAULT_TARGETS = 3
+# Bytes warmed per prediction round. Without posix_fadvise every byte is read through
+# Python and competes with the launch itself for the disk, so that path gets less
+DEFAULT_BUDGET = (128 if hasattr(os, "posix_fadvise") else 32) * 1024 * 1024
+BUDGET_WINDOW = 10 * 60  # Seconds over which the overall budget applies
+DEFAULT_WINDOW_BUDGET = 4 * DEFAULT_BUDGET  # Bytes warmed across all rounds in BUDGET_WINDOW
+WARM_TTL = 10 * 60  # Seconds a warmed file is assumed to stay in the page cache
+READ_CHUNK = 1024 * 1024
+MAX_SAMPLES = 1000  # Latency samples kept per bucket
+
+
+def record_launch(history, command, now=None):
+    stats = history.setdefault(command, {"count": 0, "last": 0})
+    stats["count"] += 1
+    stats["last"] = now or time.time()
+
+
+def _iter_apps(entries):
+    for entry in entries:
+        if isinstance(entry, dict) and "folder" in entry:
+            yield from _iter_apps(entry.get("apps", []))
+        elif isinstance(entry, dict) and entry.get("command"):
+            yield entry
+        elif isinstance(entry, str):
+            yield {"name": entry, "command": entry}
+
+
+def predict_targets(entries, history, query="", limit=DEFAULT_TARGETS, now=None):
+    """Rank configured apps by decayed launch frequency, boosted by how well they match query"""
+    now = now or time.time()
+    query = query.strip().lower()
+    scored = []
+    for app in _iter_apps(entries):
+        stats = history.get(app["command"])
+        score = 0.0
+        if stats:
+            age = max(0.0, now - stats.get("last", 0))
+            score = stats.get("count", 0) * 0.5 ** (age / HISTORY_HALF_LIFE)
+        if query:
+            name = app.get("name", "").lower()
+            if query not in name:
+                continue
+            # Matches always beat history alone; prefix matches beat substring matches
+            score += 20.0 if name.startswith(query) else 10.0
+        if score > 0:
+            scored.append((score, app))
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return [app for _, app in scored[:limit]]
+
+
+def resolve_executable(command):
+    if os.path.isfile(command):
+        return command
+    found = shutil.which(command)
+    if found:
+        return found
+    # Hand-written commands may carry arguments
+    try:
+        parts = shlex.split(command, posix=os.name != "nt")
+    except ValueError:
+        return None
+    if len(parts) > 1:
+        head = parts[0].strip('"')
+        return head if os.path.isfile(head) else shutil.which(head)
+    return None
+
+
+def _warm_file(path, budget):
+    """Pull up to budget bytes of path into the page cache, returning how many were requested"""
+    size = os.path.getsize(path)
+    length = min(size, budget)
+    if length <= 0:
+        return 0
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "posix_fadvise"):
+            # Kernel readahead runs asynchronously; no data is copied into this process
+            os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+        else:
+            remaining = length
+            while remaining > 0:
+                chunk = os.read(fd, min(READ_CHUNK, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+    finally:
+        os.close(fd)
+    return length
+
+
+class Prewarmer:
+    """Background thread that pre-reads executables and icons of predicted launch targets.
+
+    Only the latest request is kept; a newer prediction replaces one that has not started yet.
+    """
+
+    def __init__(self, budget=DEFAULT_BUDGET, window_budget=DEFAULT_WINDOW_BUDGET, ttl=WARM_TTL):
+        self.budget = budget
+        self.window_budget = window_budget
+        self.ttl = ttl
+        # (time, bytes) per round, so keystroke-driven rounds can't add up without limit
+        self._spent = deque()
+        self.enabled = True
+        self._warmed = {}
+        self._pending = None
+        self._stopped = False
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._thread = threading.Thread(target=self._run, name="prewarm", daemon=True)
+        self._thread.start()
+
+    def request(self, apps):
+        if not self.enabled:
+            return
+        with self._wake:
+            self._pending = list(apps)
+            self._wake.notify()
+
+    def is_warm(self, command):
+        with self._lock:
+            warmed_at = self._warmed.get(command)
+        return warmed_at is not None and time.monotonic() - warmed_at < self.ttl
+
+    def stop(self):
+        with self._wake:
+            self._stopped = True
+            self._wake.notify()
+
+    def _run(self):
+        while True:
+            with self._wake:
+                while self._pending is None and not self._stopped:
+                    self._wake.wait()
+                if self._stopped:
+                    return
+                apps, self._pending = self._pending, None
+            self._warm(apps)
+
+    def _window_remaining(self):
+        now = time.monotonic()
+        while self._spent and now - self._spent[0][0] > BUDGET_WINDOW:
+            self._spent.popleft()
+        return self.window_budget - sum(spent for _, spent in self._spent)
+
+    def _warm(self, apps):
+        budget = min(self.budget, self._window_remaining())
+        remaining = budget
+        for app in apps:
+            if remaining <= 0 or not self.enabled:
+                break
+            command = app["command"]
+            if self.is_warm(command):
+                continue
+            executable = resolve_executable(command)
+            warmed = False
+            for path in (executable, app.get("icon")):
+                if not path or not os.path.isfile(path) or remaining <= 0:
+                    continue
+                try:
+                    remaining -= _warm_file(path, remaining)
+                except OSError as e:
+                    print(f"Pre-warm failed for {path}: {e}")
+                    continue
+                # A warm icon alone doesn't make the launch itself any faster
+                warmed = warmed or path == executable
+            if warmed:
+                with self._lock:
+                    self._warmed[command] = time.monotonic()
+        if remaining < budget:
+            self._spent.append((time.monotonic(), budget - remaining))
+
+
+class LaunchMetrics:
+    """Time from launch until the app is ready for input, split by whether it had been pre-warmed.
+
+    Only launches with an observable ready point count: GUI apps started through
+    ShellExecuteEx on Windows. Everything else is tallied as unmeasured.
+    """
+
+    def __init__(self):
+        self._samples = {True: deque(maxlen=MAX_SAMPLES), False: deque(maxlen=MAX_SAMPLES)}
+        self._unmeasured = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds, prewarmed):
+        with self._lock:
+            self._samples[bool(prewarmed)].append(seconds)
+
+    def _skip(self):
+        with self._lock:
+            self._unmeasured += 1
+
+    def track(self, process, started, prewarmed):
+        wait_until_ready = getattr(process, "wait_until_ready", None)
+        if wait_until_ready is None:
+            self._skip()
+            return
+
+        # Waiting for input idle covers the image page-ins that pre-warming is meant to cut
+        def wait():
+            try:
+                if wait_until_ready():
+                    self.record(time.perf_counter() - started, prewarmed)
+                else:
+                    self._skip()
+            finally:
+                process.close()
+
+        threading.Thread(target=wait, name="launch-metrics", daemon=True).start()
+
+    def summary(self):
+        lines = ["Time from launch until the app is ready for input:"]
+        with self._lock:
+            for label, prewarmed in (("Pre-warmed", True), ("Cold", False)):
+                samples = self._samples[prewarmed]
+                if samples:
+                    lines.append(
+                        f"{label}: {len(samples)} launches, mean {mean(samples) * 1000:.0f} ms, "
+                        f"median {median(samples) * 1000:.0f} ms"
+                    )
+                else:
+                    lines.append(f"{label}: no launches yet")
+            if self._unmeasured:
+                lines.append(f"Not measured (no ready point to observe): {self._unmeasured}")
+        return "\n".join(lines)
@@ -0,0 +1,338 @@
+"""Headless soak test for the launcher.
+
+Scripts thousands of hotkey toggles, searches, config rewrites, editor edits and
+launches against a stub launch backend, sampling RSS, Python object counts and
+per-operation latency as it goes. Exits with status 1 if any of them keeps growing.
+
+    python soak.py --cycles 20000
+"""
+import os
+import sys
+import gc
+import time
+import random
+import argparse
+import tempfile
+from collections import Counter, defaultdict
+from statistics import mean, median
+
+APP_POOL = [f"Soak App {i}" for i in range(200)]
+FOLDER_POOL = [f"Soak Folder {i}" for i in range(10)]
+QUERIES = ["", "soak", "app 1", "folder", "zzz", "1", "app 19"]
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+ICON_POOL = [os.path.join(ICON_DIR, name) for name in ("notepad.png", "settings.png", "settings-dark.png")]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Long-running soak test for AppLauncher")
+    parser.add_argument("--cycles", type=int, default=5000, help="Operations to run (default: 5000)")
+    parser.add_argument("--duration", type=float, default=0, help="Run for this many seconds instead of --cycles")
+    parser.add_argument("--sample-every", type=int, default=100, help="Operations between samples (default: 100)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-rss-growth", type=float, default=20.0, help="Allowed RSS growth in MiB (default: 20)")
+    parser.add_argument("--max-object-growth", type=float, default=0.05,
+                        help="Allowed growth in live Python objects, as a fraction (default: 0.05)")
+    parser.add_argument("--max-latency-growth", type=float, default=2.0,
+                        help="Allowed ratio between late and early median latency per operation (default: 2.0)")
+    return parser.parse_args()
+
+
+def read_rss():
+    """Resident set size in bytes, or None where it can't be read"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource
+        # ru_maxrss is a high-water mark, which still catches steady growth
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except ImportError:
+        return None
+
+
+class StubProcess:
+    """Stands in for utils.ShellProcess, so launch metrics are exercised too"""
+
+    def wait_until_ready(self, timeout_ms=0):
+        return True
+
+    def close(self):
+        pass
+
+
+class Soak:
+    def __init__(self, args):
+        # Imported here so APPDATA and the Qt platform are set up before config.py runs
+        from PySide6.QtWidgets import QApplication, QMessageBox
+        from PySide6.QtCore import QTimer
+        from PySide6.QtGui import QPixmapCache
+        import config
+        import ui.launcher
+        import ui.config_editor
+
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.config_module = config
+        self.QTimer = QTimer
+        self.QPixmapCache = QPixmapCache
+        self.app = QApplication.instance() or QApplication(sys.argv)
+
+        # Stub backend: nothing is spawned and no dialog blocks the run
+        self.launches = 0
+        ui.launcher.launch_app = self.stub_launch
+        QMessageBox.information = staticmethod(lambda *a, **k: QMessageBox.Ok)
+        QMessageBox.warning = staticmethod(lambda *a, **k: QMessageBox.Ok)
+
+        # singleShot timers are internal to Qt and never show up in findChildren,
+        # so count pending callbacks on the way in and out instead
+        self.single_shots_pending = 0
+        self.status_single_shots = 0
+        self.original_single_shot = QTimer.singleShot
+        QTimer.singleShot = staticmethod(self.tracked_single_shot)
+
+        config.save_config(self.random_config())
+        self.launcher = ui.launcher.AppLauncher()
+        self.launcher.open_config_editor()
+        self.editor = self.launcher.editor
+
+        self.operations = [
+            ("toggle", self.op_toggle),
+            ("close", self.op_close),
+            ("search", self.op_search),
+            ("rewrite_config", self.op_rewrite_config),
+            ("editor_add_remove", self.op_editor_add_remove),
+            ("editor_edit", self.op_editor_edit),
+            ("editor_reload", self.op_editor_reload),
+            ("launch", self.op_launch),
+        ]
+        # Raw durations are folded into one median per sample window so the harness
+        # itself stays flat; samples are plain tuples, which gc stops tracking
+        self.latencies = defaultdict(list)
+        self.latency_windows = defaultdict(list)
+        self.samples = []
+        self.first_types = None
+        self.last_types = None
+
+    def tracked_single_shot(self, msec, *args):
+        # show_status restarts one reusable timer; a singleShot per message there stays bounded
+        # at a steady rate, so peak growth alone can miss it coming back
+        if sys._getframe(1).f_code.co_name == "show_status":
+            self.status_single_shots += 1
+        if len(args) == 1 and callable(args[0]):
+            callback = args[0]
+            self.single_shots_pending += 1
+
+            def fire():
+                self.single_shots_pending -= 1
+                callback()
+
+            return self.original_single_shot(msec, fire)
+        return self.original_single_shot(msec, *args)
+
+    def stub_launch(self, command):
+        self.launches += 1
+        return StubProcess()
+
+    def random_app(self, name):
+        app = {"name": name, "command": f"{name.lower().replace(' ', '_')}.exe"}
+        # Real icon files, so every reload builds QIcons and drops the old ones
+        if self.rng.random() < 0.5:
+            app["icon"] = self.rng.choice(ICON_POOL)
+        return app
+
+    def random_config(self):
+        apps = [self.random_app(name) for name in self.rng.sample(APP_POOL, 40)]
+        for folder in self.rng.sample(FOLDER_POOL, 3):
+            apps.append({
+                "folder": folder,
+                "icon": self.rng.choice(ICON_POOL),
+                "apps": [self.random_app(name) for name in self.rng.sample(APP_POOL, 10)]
+            })
+        return {"apps": apps}
+
+    def pump(self, seconds=0.0):
+        deadline = time.perf_counter() + seconds
+        while True:
+            self.app.processEvents()
+            if time.perf_counter() >= deadline:
+                return
+
+    def app_items(self, tree):
+        items = []
+
+        def walk(item):
+            for i in range(item.childCount()):
+                child = item.child(i)
+                if child.childCount():
+                    walk(child)
+                else:
+                    items.append(child)
+
+        walk(tree.invisibleRootItem())
+        return items
+
+    def op_toggle(self):
+        # Same call the global hotkey makes
+        self.launcher.setVisible(not self.launcher.isVisible())
+
+    def op_close(self):
+        self.launcher.show()
+        self.launcher.close()
+
+    def op_search(self):
+        self.launcher.search_bar.setText(self.rng.choice(QUERIES))
+
+    def op_rewrite_config(self):
+        self.config_module.save_config(self.random_config())
+        # Give the watcher a chance to deliver fileChanged
+        self.pump(0.005)
+
+    def op_editor_add_remove(self):
+        name = f"Soak Temp {self.rng.randrange(5)}"
+        self.editor.tree.setCurrentItem(None)
+        self.editor.name_edit.setText(name)
+        self.editor.command_edit.setText("temp.exe")
+        self.editor.add_app()
+        for item in self.app_items(self.editor.tree):
+            if item.text(0) == name and item.parent() is None:
+                self.editor.tree.setCurrentItem(item)
+                self.editor.remove_selected()
+                break
+
+    def op_editor_edit(self):
+        items = self.app_items(self.editor.tree)
+        if not items:
+            return
+        self.editor.tree.setCurrentItem(self.rng.choice(items))
+        self.editor.edit_selected()
+        name = self.editor.name_edit.text()
+        self.editor.name_edit.setText(name[:-1] if name.endswith("*") else name + "*")
+        self.editor.apply_edit()
+
+    def op_editor_reload(self):
+        self.editor.reload_from_disk()
+
+    def op_launch(self):
+        items = self.app_items(self.launcher.tree)
+        if items:
+            self.launcher.launch_item(self.rng.choice(items), 0)
+
+    def take_sample(self, cycle):
+        for name, durations in self.latencies.items():
+            if durations:
+                self.latency_windows[name].append(median(durations))
+                durations.clear()
+        gc.collect()
+        # Icon pixmaps fill Qt's bounded cache at random; empty it so RSS reflects leaks only
+        self.QPixmapCache.clear()
+        objects = gc.get_objects()
+        types = Counter(type(obj).__name__ for obj in objects)
+        timers = len(self.launcher.findChildren(self.QTimer)) + len(self.editor.findChildren(self.QTimer))
+        self.samples.append((cycle, read_rss(), len(objects), types.get("QTreeWidgetItem", 0), timers,
+                             self.single_shots_pending, types.get("QIcon", 0)))
+        self.first_types = self.first_types or types
+        self.last_types = types
+        del objects
+
+    def run(self):
+        started = time.perf_counter()
+        cycle = 0
+        while True:
+            if self.args.duration:
+                if time.perf_counter() - started >= self.args.duration:
+                    break
+            elif cycle >= self.args.cycles:
+                break
+            if cycle % self.args.sample_every == 0:
+                self.take_sample(cycle)
+                self.report_progress()
+            name, operation = self.rng.choice(self.operations)
+            op_started = time.perf_counter()
+            operation()
+            self.latencies[name].append(time.perf_counter() - op_started)
+            self.pump()
+            cycle += 1
+        self.pump(0.1)
+        self.take_sample(cycle)
+        self.launcher.prewarmer.stop()
+        return cycle
+
+    def report_progress(self):
+        cycle, rss, objects, tree_items, timers, pending, icons = self.samples[-1]
+        rss = f"{rss / 2**20:.1f} MiB" if rss else "n/a"
+        print(f"[{cycle:>7}] rss {rss}, objects {objects}, tree items {tree_items}, icons {icons}, "
+              f"timers {timers}, pending singleShots {pending}", flush=True)
+
+    def check(self):
+        """Compare the early and late parts of the run, returning a list of failure messages"""
+        failures = []
+        # The first quarter is warm-up: caches, lazily created widgets and the like
+        quarter = max(1, len(self.samples) // 4)
+        early = self.samples[quarter:2 * quarter] or self.samples[:1]
+        late = self.samples[-quarter:]
+
+        rss_early = [s[1] for s in early if s[1]]
+        rss_late = [s[1] for s in late if s[1]]
+        if rss_early and rss_late:
+            # Medians, so a sample taken while a window's backing store is alive doesn't read as growth
+            growth = (median(rss_late) - median(rss_early)) / 2**20
+            print(f"RSS growth: {growth:.1f} MiB")
+            if growth > self.args.max_rss_growth:
+                failures.append(f"RSS grew by {growth:.1f} MiB (limit {self.args.max_rss_growth} MiB)")
+
+        objects_early = mean(s[2] for s in early)
+        objects_late = mean(s[2] for s in late)
+        growth = (objects_late - objects_early) / objects_early
+        print(f"Object growth: {growth:+.1%}")
+        if growth > self.args.max_object_growth:
+            grown = self.last_types - self.first_types
+            top = ", ".join(f"{name} +{count}" for name, count in grown.most_common(5))
+            failures.append(f"Live objects grew by {growth:.1%} (limit {self.args.max_object_growth:.0%}); top: {top}")
+
+        for index, label in ((3, "QTreeWidgetItem wrappers"), (6, "QIcon wrappers"), (4, "QTimers"),
+                             (5, "Pending QTimer.singleShot callbacks")):
+            early_peak = max(s[index] for s in early)
+            late_peak = max(s[index] for s in late)
+            if late_peak > early_peak:
+                failures.append(f"{label} kept growing: peak {early_peak} early, {late_peak} late")
+        if self.status_single_shots:
+            failures.append(f"show_status scheduled {self.status_single_shots} QTimer.singleShot callbacks "
+                            f"instead of restarting status_timer")
+
+        for name, windows in sorted(self.latency_windows.items()):
+            if len(windows) < 4:
+                continue
+            part = len(windows) // 4
+            early_median = median(windows[part:2 * part])
+            late_median = median(windows[-part:])
+            print(f"{name}: median {early_median * 1000:.2f} ms -> {late_median * 1000:.2f} ms")
+            # Ignore drift that is within timer noise
+            if late_median > early_median * self.args.max_latency_growth and late_median - early_median > 0.002:
+                failures.append(f"{name} latency drifted from {early_median * 1000:.2f} ms "
+                                f"to {late_median * 1000:.2f} ms")
+        return failures
+
+
+def main():
+    args = parse_args()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    with tempfile.TemporaryDirectory(prefix="launcher-soak-") as appdata:
+        os.environ["APPDATA"] = appdata
+        os.makedirs(os.path.join(appdata, "AppLauncher"), exist_ok=True)
+        soak = Soak(args)
+        cycles = soak.run()
+        print(f"Ran {cycles} operations ({soak.launches} stub launches)")
+        failures = soak.check()
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
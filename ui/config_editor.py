@@ -1,9 +1,12 @@
+import time
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QFileDialog, QLineEdit, QTreeWidget, QTreeWidgetItem, QAbstractItemView, QMessageBox
+    QFileDialog, QLineEdit, QTreeWidget, QTreeWidgetItem, QAbstractItemView, QMessageBox,
+    QMenu, QProgressDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThread, Signal
 from config import load_config, save_config
+from importer import iter_entries, entry_key, build_key_index
 
 
 class AppTreeWidget(QTreeWidget):
@@ -20,6 +23,49 @@ class AppTreeWidget(QTreeWidget):
         super().dropEvent(event)
 
 
+class ImportWorker(QThread):
+    """Parses an import source off the UI thread and hands new apps over in batches"""
+    batch_ready = Signal(list)
+    progress = Signal(int, int, int)
+    failed = Signal(str)
+
+    BATCH_SIZE = 250
+    PROGRESS_INTERVAL = 0.1  # Seconds between progress updates, counting skipped entries too
+
+    def __init__(self, source, existing_keys, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.existing_keys = existing_keys
+
+    def run(self):
+        imported = skipped = 0
+        unsupported = []
+        batch = []
+        last_progress = time.monotonic()
+        try:
+            for app in iter_entries(self.source, lambda path, reason: unsupported.append(path)):
+                if self.isInterruptionRequested():
+                    return
+                key = entry_key(app)
+                if not key or key in self.existing_keys:
+                    skipped += 1
+                else:
+                    self.existing_keys.add(key)
+                    batch.append(app)
+                    imported += 1
+                if len(batch) >= self.BATCH_SIZE:
+                    self.batch_ready.emit(batch)
+                    batch = []
+                if time.monotonic() - last_progress >= self.PROGRESS_INTERVAL:
+                    self.progress.emit(imported, skipped, len(unsupported))
+                    last_progress = time.monotonic()
+            if batch:
+                self.batch_ready.emit(batch)
+            self.progress.emit(imported, skipped, len(unsupported))
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
 class ConfigEditor(QWidget):
     def __init__(self, launcher=None):
         super().__init__()
@@ -72,11 +118,20 @@ class ConfigEditor(QWidget):
         apply_edit_btn = QPushButton("Apply Edit")
         apply_edit_btn.clicked.connect(self.apply_edit)
         btn_layout.addWidget(apply_edit_btn)
+        import_btn = QPushButton("Import")
+        import_menu = QMenu(import_btn)
+        import_menu.addAction("From Shortcut Folder...", self.import_folder)
+        import_menu.addAction("From JSON/CSV List...", self.import_list)
+        import_btn.setMenu(import_menu)
+        btn_layout.addWidget(import_btn)
         layout.addLayout(btn_layout)
 
         self.config = load_config()
         self.reload_tree()
         self.editing_item = None
+        self.import_worker = None
+        self.import_progress = None
+        self.import_error = None
 
     def choose_icon(self):
         path, _ = QFileDialog.getOpenFileName(self, "Choose Icon", "", "Images (*.png *.ico *.jpg *.bmp)")
@@ -94,9 +149,7 @@ class ConfigEditor(QWidget):
                     add_items(folder_item, entry.get("apps", []))
                     parent.addChild(folder_item)
                 elif isinstance(entry, dict):
-                    app_item = QTreeWidgetItem([entry.get("name", ""), entry.get("command", ""), entry.get("icon", "")])
-                    app_item.setData(0, Qt.UserRole, entry)
-                    parent.addChild(app_item)
+                    parent.addChild(self._make_app_item(entry))
 
         root = self.tree.invisibleRootItem()
         add_items(root, self.config.get("apps", []))
@@ -105,6 +158,11 @@ class ConfigEditor(QWidget):
         self.command_edit.clear()
         self.icon_edit.clear()
 
+    def _make_app_item(self, entry):
+        app_item = QTreeWidgetItem([entry.get("name", ""), entry.get("command", ""), entry.get("icon", "")])
+        app_item.setData(0, Qt.UserRole, entry)
+        return app_item
+
     def add_app(self):
         name = self.name_edit.text().strip()
         command = self.command_edit.text().strip()
@@ -149,6 +207,99 @@ class ConfigEditor(QWidget):
                     return True
         return False
 
+    def _find_folder_apps(self, entries, folder_name):
+        for entry in entries:
+            if isinstance(entry, dict) and entry.get("folder") == folder_name:
+                return entry.setdefault("apps", [])
+            if isinstance(entry, dict) and "apps" in entry:
+                found = self._find_folder_apps(entry["apps"], folder_name)
+                if found is not None:
+                    return found
+        return None
+
+    def import_folder(self):
+        path = QFileDialog.getExistingDirectory(self, "Import Shortcuts From Folder")
+        if path:
+            self.start_import(path)
+
+    def import_list(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Shortcut List", "", "Shortcut lists (*.json *.csv)")
+        if path:
+            self.start_import(path)
+
+    def start_import(self, source):
+        if self.import_worker is not None:
+            QMessageBox.warning(self, "Import", "An import is already running.")
+            return
+
+        # Same placement rules as add_app: into the selected folder, or the selected app's folder
+        self.import_target_item = self.tree.invisibleRootItem()
+        self.import_target_apps = self.config.setdefault("apps", [])
+        selected = self.tree.currentItem()
+        if selected and not self._is_folder_item(selected):
+            selected = selected.parent()
+        if selected and self._is_folder_item(selected):
+            folder_apps = self._find_folder_apps(self.config["apps"], selected.data(0, Qt.UserRole)["folder"])
+            if folder_apps is not None:
+                self.import_target_item = selected
+                self.import_target_apps = folder_apps
+
+        self.import_worker = ImportWorker(source, build_key_index(self.config["apps"]), self)
+        self.import_worker.batch_ready.connect(self._insert_import_batch)
+        self.import_worker.progress.connect(self._update_import_progress)
+        self.import_worker.failed.connect(self._import_failed)
+        self.import_worker.finished.connect(self._finish_import)
+
+        self.import_progress = QProgressDialog("Importing shortcuts...", "Cancel", 0, 0, self)
+        self.import_progress.setWindowTitle("Import")
+        self.import_progress.setWindowModality(Qt.WindowModal)
+        self.import_progress.setMinimumDuration(0)
+        self.import_progress.canceled.connect(self.import_worker.requestInterruption)
+        self.import_progress.show()
+
+        self.import_counts = (0, 0, 0)
+        self.import_error = None
+        self.import_worker.start()
+
+    def _is_folder_item(self, item):
+        data = item.data(0, Qt.UserRole)
+        return isinstance(data, dict) and "folder" in data
+
+    def _insert_import_batch(self, batch):
+        # Batches queued before a cancel are dropped so tree and config stay in step
+        if self.import_worker is None or self.import_worker.isInterruptionRequested():
+            return
+        self.import_target_apps.extend(batch)
+        self.tree.setUpdatesEnabled(False)
+        self.import_target_item.addChildren([self._make_app_item(app) for app in batch])
+        self.tree.setUpdatesEnabled(True)
+
+    def _update_import_progress(self, imported, skipped, unsupported):
+        self.import_counts = (imported, skipped, unsupported)
+        if self.import_progress:
+            self.import_progress.setLabelText(
+                f"Imported {imported} shortcuts, skipped {skipped} duplicates and {unsupported} unsupported..."
+            )
+
+    def _import_failed(self, error):
+        self.import_error = error
+        QMessageBox.warning(self, "Import Error", f"Failed to import shortcuts:\n{error}")
+
+    def _finish_import(self):
+        canceled = self.import_worker.isInterruptionRequested()
+        self.import_worker.deleteLater()
+        self.import_worker = None
+        if self.import_progress:
+            self.import_progress.close()
+            self.import_progress.deleteLater()
+            self.import_progress = None
+        if not canceled and self.import_error is None:
+            imported, skipped, unsupported = self.import_counts
+            message = f"Imported {imported} shortcuts ({skipped} duplicates skipped)."
+            if unsupported:
+                message += f"\n{unsupported} shortcuts need command-line arguments and were not imported."
+            QMessageBox.information(self, "Import", message + "\nSave the config to keep them.")
+
     def add_folder(self):
         name = self.name_edit.text().strip()
         icon = self.icon_edit.text().strip()
@@ -236,7 +387,10 @@ class ConfigEditor(QWidget):
 
     def save(self):
         try:
-            self.config["apps"] = self._tree_to_config(self.tree.invisibleRootItem())
+            # Start from the file on disk so settings changed elsewhere (e.g. the tray's prewarm toggle) survive
+            config = load_config()
+            config["apps"] = self._tree_to_config(self.tree.invisibleRootItem())
+            self.config = config
             save_config(self.config)
             QMessageBox.information(self, "Success", "Config saved!")
             if self.launcher:
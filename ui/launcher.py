@@ -1,4 +1,5 @@
 import os
+import time
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QFileDialog, QTextEdit, QLineEdit, QListWidget, QListWidgetItem, QTreeWidget,
@@ -7,8 +8,9 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QFileSystemWatcher, QEvent, QTimer, QSize
 from PySide6.QtGui import QPalette, QColor, QFont, QIcon, QGuiApplication, QAction, QPainterPath, QRegion, QPainter, QPen, QCursor
-from config import load_config, save_config, CONFIG_PATH
+from config import load_config, save_config, load_history, save_history, CONFIG_PATH
 from utils import resource_path, launch_app
+from prewarm import Prewarmer, LaunchMetrics, predict_targets, record_launch
 from ui.config_editor import ConfigEditor
 
 class HoverIconButton(QPushButton):
@@ -62,6 +64,7 @@ class AppLauncher(QWidget):
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search apps and folders...")
         self.search_bar.textChanged.connect(self.filter_apps)
+        self.search_bar.textChanged.connect(self.schedule_prewarm)
         self.search_bar.setStyleSheet("padding: 6px; border-radius: 8px; background: transparent; color: white;")
         search_layout.addWidget(self.search_bar)
 
@@ -120,6 +123,10 @@ class AppLauncher(QWidget):
         self.status_label = QLabel("")
         self.status_label.setStyleSheet("color: #aaa; font-size: 12px; padding: 4px 0 0 4px;")
         central_layout.addWidget(self.status_label)
+        # One reusable timer, so repeated messages don't queue up stale clears
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.timeout.connect(self.status_label.clear)
 
         # Add tray icon
         self.tray_icon = QSystemTrayIcon(self)
@@ -137,6 +144,15 @@ class AppLauncher(QWidget):
         show_launcher_action.triggered.connect(self.show_launcher_from_tray)
         tray_menu.addAction(show_launcher_action)
 
+        self.prewarm_action = QAction("Pre-warm Launch Targets", self)
+        self.prewarm_action.setCheckable(True)
+        self.prewarm_action.toggled.connect(self.set_prewarm_enabled)
+        tray_menu.addAction(self.prewarm_action)
+
+        metrics_action = QAction("Show Launch Metrics", self)
+        metrics_action.triggered.connect(self.show_launch_metrics)
+        tray_menu.addAction(metrics_action)
+
         quit_action = QAction("Quit", self)
         quit_action.triggered.connect(self.quit_app)
         tray_menu.addAction(quit_action)
@@ -148,6 +164,16 @@ class AppLauncher(QWidget):
         self.config = load_config()
         self.populate_apps()
 
+        # Pre-read likely-next targets while the window is open, so cold launches skip disk reads
+        self.history = load_history()
+        self.launch_metrics = LaunchMetrics()
+        self.prewarmer = Prewarmer()
+        self.prewarm_timer = QTimer(self)
+        self.prewarm_timer.setSingleShot(True)
+        self.prewarm_timer.setInterval(150)
+        self.prewarm_timer.timeout.connect(self.prewarm_predicted)
+        self.apply_prewarm_setting()
+
         self.watcher = QFileSystemWatcher([CONFIG_PATH])
         self.watcher.fileChanged.connect(self.on_config_changed)
 
@@ -159,6 +185,7 @@ class AppLauncher(QWidget):
         y = screen.y() + screen.height() - self.height() - taskbar_height + 8
         self.move(x, y)
         super().showEvent(event)
+        self.schedule_prewarm()
 
     def closeEvent(self, event):
         event.ignore()
@@ -275,12 +302,46 @@ class AppLauncher(QWidget):
     def launch_item(self, item, column):
         command = item.data(0, Qt.UserRole)
         if command:
-            launch_app(command)
+            prewarmed = self.prewarmer.is_warm(command)
+            started = time.perf_counter()
+            process = launch_app(command)
+            if process:
+                self.launch_metrics.track(process, started, prewarmed)
+                # Failed launches stay out of history, so they're never predicted or pre-warmed
+                record_launch(self.history, command)
+                save_history(self.history)
             self.show_status(f"Launched: {item.text(0)}", 2000)
 
+    def schedule_prewarm(self, *args):
+        if self.prewarmer.enabled and self.isVisible():
+            self.prewarm_timer.start()
+
+    def prewarm_predicted(self):
+        if not self.isVisible():
+            return
+        targets = predict_targets(self.config.get("apps", []), self.history, self.search_bar.text())
+        if targets:
+            self.prewarmer.request(targets)
+
+    def apply_prewarm_setting(self):
+        enabled = bool(self.config.get("prewarm", True))
+        self.prewarmer.enabled = enabled
+        self.prewarm_action.blockSignals(True)
+        self.prewarm_action.setChecked(enabled)
+        self.prewarm_action.blockSignals(False)
+
+    def set_prewarm_enabled(self, enabled):
+        self.config["prewarm"] = enabled
+        self.prewarmer.enabled = enabled
+        save_config(self.config)
+
+    def show_launch_metrics(self):
+        QMessageBox.information(self, "Launch Metrics", self.launch_metrics.summary())
+
     def on_config_changed(self):
         self.config = load_config()
         self.populate_apps()
+        self.apply_prewarm_setting()
         self.show_status("Config reloaded", 2000)
 
     def open_config_editor(self):
@@ -293,7 +354,9 @@ class AppLauncher(QWidget):
     def show_status(self, msg, timeout=2000):
         self.status_label.setText(msg)
         if timeout:
-            QTimer.singleShot(timeout, lambda: self.status_label.setText(""))
+            self.status_timer.start(timeout)
+        else:
+            self.status_timer.stop()
 
     def show_launcher_from_tray(self):
         self.show()
@@ -301,6 +364,7 @@ class AppLauncher(QWidget):
         self.activateWindow()
 
     def quit_app(self):
+        self.prewarmer.stop()
         self.tray_icon.hide()
         QApplication.quit()
 
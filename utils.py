@@ -3,14 +3,92 @@ import os
 import subprocess
 from PySide6.QtWidgets import QMessageBox
 
+INPUT_IDLE_TIMEOUT_MS = 30000
+
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     if hasattr(sys, '_MEIPASS'):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+
+    SEE_MASK_NOCLOSEPROCESS = 0x00000040
+    SEE_MASK_FLAG_NO_UI = 0x00000400
+    SW_SHOWNORMAL = 1
+    WAIT_OBJECT_0 = 0
+
+    class SHELLEXECUTEINFOW(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("fMask", wintypes.ULONG),
+            ("hwnd", wintypes.HWND),
+            ("lpVerb", wintypes.LPCWSTR),
+            ("lpFile", wintypes.LPCWSTR),
+            ("lpParameters", wintypes.LPCWSTR),
+            ("lpDirectory", wintypes.LPCWSTR),
+            ("nShow", ctypes.c_int),
+            ("hInstApp", wintypes.HINSTANCE),
+            ("lpIDList", ctypes.c_void_p),
+            ("lpClass", wintypes.LPCWSTR),
+            ("hkeyClass", wintypes.HKEY),
+            ("dwHotKey", wintypes.DWORD),
+            ("hIconOrMonitor", wintypes.HANDLE),
+            ("hProcess", wintypes.HANDLE),
+        ]
+
+    # Own WinDLL instances, so these prototypes don't leak into other windll users
+    _shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+    _shell32.ShellExecuteExW.argtypes = [ctypes.POINTER(SHELLEXECUTEINFOW)]
+    _shell32.ShellExecuteExW.restype = wintypes.BOOL
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _user32.WaitForInputIdle.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _user32.WaitForInputIdle.restype = wintypes.DWORD
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+    class ShellProcess:
+        """Process handle of an app started through ShellExecuteEx"""
+
+        def __init__(self, handle):
+            self.handle = handle
+
+        def wait_until_ready(self, timeout_ms=INPUT_IDLE_TIMEOUT_MS):
+            """Block until the app has loaded and waits for input; False if that can't be observed"""
+            # No handle when the shell handed off to a running process (e.g. a URL to an open browser);
+            # console apps have no input queue, so WaitForInputIdle fails for them
+            if not self.handle:
+                return False
+            return _user32.WaitForInputIdle(self.handle, timeout_ms) == WAIT_OBJECT_0
+
+        def close(self):
+            if self.handle:
+                _kernel32.CloseHandle(self.handle)
+                self.handle = None
+
+        def __del__(self):
+            self.close()
+
+    def _shell_execute(command):
+        # Same resolution as `start`: PATH, App Paths, file associations, .lnk and URLs
+        info = SHELLEXECUTEINFOW()
+        info.cbSize = ctypes.sizeof(info)
+        # NO_UI: failures surface once, through launch_app's own message box
+        info.fMask = SEE_MASK_NOCLOSEPROCESS | SEE_MASK_FLAG_NO_UI
+        info.lpFile = command
+        info.nShow = SW_SHOWNORMAL
+        if not _shell32.ShellExecuteExW(ctypes.byref(info)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return ShellProcess(info.hProcess)
+
 def launch_app(command):
     try:
-        subprocess.Popen(f'start "" "{command}"', shell=True)
+        if os.name == "nt":
+            return _shell_execute(command)
+        return subprocess.Popen(f'start "" "{command}"', shell=True)
     except Exception as e:
-        QMessageBox.warning(None, "Launch Error", f"Failed to launch {command}:\n{e}")
\ No newline at end of file
+        QMessageBox.warning(None, "Launch Error", f"Failed to launch {command}:\n{e}")
+    return None